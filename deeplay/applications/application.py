@@ -182,17 +182,14 @@ class Application(DeeplayModule, L.LightningModule):
                     return self.parameters()
 
     def named_children(self) -> Iterator[Tuple[str, Module]]:
-        name_child_iterator = list(super().named_children())
         # optimizers last
-        not_optimizers = [
-            (name, child)
-            for name, child in name_child_iterator
-            if not isinstance(child, Optimizer)
-        ]
-        optimizers = [
-            (name, child)
-            for name, child in name_child_iterator
-            if isinstance(child, Optimizer)
-        ]
+        not_optimizers = []
+        optimizers = []
+        for name, child in super().named_children():
+            if isinstance(child, Optimizer):
+                optimizers.append((name, child))
+            else:
+                not_optimizers.append((name, child))
 
-        yield from (not_optimizers + optimizers)
+        yield from not_optimizers
+        yield from optimizers
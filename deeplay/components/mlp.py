@@ -146,7 +146,7 @@ class MultiLayerPerceptron(DeeplayModule):
         )
 
     def forward(self, x):
-        x = nn.Flatten()(x)
+        x = x.flatten(start_dim=1)
         for block in self.blocks:
             x = block(x)
         return x
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any, Callable, Optional, TypeVar, overload
 import inspect
 from ..module import DeeplayModule
+from .. import utils
 
 import torch.nn as nn
 
@@ -109,7 +110,7 @@ class External(DeeplayModule):
         classtype = self.classtype
 
         init_method = classtype.__init__ if inspect.isclass(classtype) else classtype
-        argspec = inspect.getfullargspec(init_method)
+        argspec = utils.getfullargspec(init_method)
 
         if "self" in argspec.args:
             argspec.args.remove("self")
@@ -117,7 +118,7 @@ class External(DeeplayModule):
         if not argspec.args and issubclass(classtype, nn.RNNBase):
             # This is a hack to get around torch RNN classes
             parent_init = classtype.__mro__[1].__init__
-            argspec = inspect.getfullargspec(parent_init)
+            argspec = utils.getfullargspec(parent_init)
             argspec.args.remove("self")
             argspec.args.remove("mode")
 
@@ -128,11 +129,11 @@ class External(DeeplayModule):
         if issubclass(classtype, DeeplayModule):
             return classtype.get_signature()
         elif issubclass(classtype, nn.RNNBase):
-            signature = inspect.signature(classtype.__mro__[1])
+            signature = utils.signature(classtype.__mro__[1])
             params = list(signature.parameters.values())
             params.pop(0)  # corresponding "mode" in RNNBase
             return inspect.Signature(params)
-        return inspect.signature(classtype)
+        return utils.signature(classtype)
 
     def build_arguments_from(self, *args, classtype, **kwargs):
         kwargs = super().build_arguments_from(*args, **kwargs)
@@ -22,22 +22,33 @@ class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
         while len(self):
             super().pop(0)
 
-        for idx, layer in enumerate(layers):
-            super().append(layer)
-            if isinstance(layer, DeeplayModule) and not layer._has_built:
-                self._give_user_configuration(layer, self._get_abs_string_index(idx))
-                layer.__construct__()
+        for layer in layers:
+            self._append_and_construct(layer)
 
     def append(self, module: DeeplayModule) -> "LayerList[T]":
         if not self._has_built:
+            in_sync = len(self) == len(self._args)
             self._args = (*self._args, module)
-            self.__construct__()
+            if in_sync:
+                # Only the new layer needs to be constructed. Reconstructing
+                # the whole list would make n appends O(n^2).
+                self._append_and_construct(module)
+            else:
+                self.__construct__()
 
         else:
             super().append(module)
 
         return self
 
+    def _append_and_construct(self, layer: T):
+        super().append(layer)
+        if isinstance(layer, DeeplayModule) and not layer._has_built:
+            self._give_user_configuration(
+                layer, self._get_abs_string_index(len(self) - 1)
+            )
+            layer.__construct__()
+
     def pop(self, index: int = -1) -> T:
         args = list(self._args)
         args.pop(index)
@@ -82,15 +93,15 @@ class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
             return super().__getattr__(name)
         except AttributeError:
             # check if name is integer string
-            if name[0] in ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9"):
+            if name[:1].isdigit():
                 # is an invalid attribute name so must be an index
                 raise
 
-            submodules = [
-                getattr(layer, name)
-                for layer in self
-                if hasattr(layer, name) and isinstance(getattr(layer, name), nn.Module)
-            ]
+            submodules = []
+            for layer in self:
+                submodule = getattr(layer, name, None)
+                if isinstance(submodule, nn.Module):
+                    submodules.append(submodule)
             if len(submodules) > 0:
                 return LayerList(*submodules)
             else:
@@ -28,14 +28,19 @@ class ExtendedConstructorMeta(type):
         return obj
 
 
-def not_top_level(cls: ExtendedConstructorMeta):
-    current_value = cls._is_top_level["value"]
+class _NotTopLevel:
+    __slots__ = ("cls", "current_value")
+
+    def __init__(self, cls: ExtendedConstructorMeta):
+        self.cls = cls
+        self.current_value = cls._is_top_level["value"]
 
-    class ContextManager:
-        def __enter__(self):
-            cls._is_top_level["value"] = False
+    def __enter__(self):
+        self.cls._is_top_level["value"] = False
 
-        def __exit__(self, *args):
-            cls._is_top_level["value"] = current_value
+    def __exit__(self, *args):
+        self.cls._is_top_level["value"] = self.current_value
 
-    return ContextManager()
+
+def not_top_level(cls: ExtendedConstructorMeta):
+    return _NotTopLevel(cls)
@@ -1,10 +1,10 @@
-import inspect
-from typing import Any, Dict, Tuple, List, Set
+from typing import Any, Dict, Optional, Tuple, List, Set
 
 import torch.nn as nn
 
 from .meta import ExtendedConstructorMeta, not_top_level
 from .decorators import before_build
+from . import utils
 
 
 class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
@@ -77,6 +77,7 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
     __config_containers__: List[str] = ["_user_config", "_hooks"]
 
     _user_config: Dict[Tuple[str, ...], Any]
+    _user_config_by_head: Optional[Dict[str, Dict[Tuple[str, ...], Any]]] = None
     _is_constructing: bool = False
     _is_building: bool = False
 
@@ -358,6 +359,10 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
         for container in self.__config_containers__:
             setattr(obj, container, getattr(self, container).copy())
 
+        # The hook lists must not be shared, otherwise hooks registered on
+        # the new instance would also run when the original is built.
+        obj._hooks = {name: hooks.copy() for name, hooks in self._hooks.items()}
+
         return obj
 
     def register_before_build_hook(self, func):
@@ -415,8 +420,10 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
         return self._user_config
 
     def _configure_kwargs(self, kwargs):
+        # Validate all names at once so that configurables is only computed
+        # once, and so that nothing is set if any name is invalid.
+        self._assert_valid_configurable(*kwargs)
         for name, value in kwargs.items():
-            self._assert_valid_configurable(name)
             self._user_config[(name,)] = value
         self.__construct__()
 
@@ -435,11 +442,23 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
     def _give_user_configuration(self, receiver: "DeeplayModule", name):
         if self._user_config is not None:
             sub_config = receiver._collect_user_configuration()
-            for key, value in self._user_config.items():
-                if len(key) > 1 and key[0] == name:
-                    sub_config[key[1:]] = value
+            if self._user_config_by_head is not None:
+                # During construction the configuration is already
+                # partitioned by child name, see `__construct__`.
+                sub_config.update(self._user_config_by_head.get(name, {}))
+            else:
+                for key, value in self._user_config.items():
+                    if len(key) > 1 and key[0] == name:
+                        sub_config[key[1:]] = value
             receiver._take_user_configuration(sub_config)
 
+    def _partition_user_configuration(self):
+        partition: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+        for key, value in self._user_config.items():
+            if len(key) > 1:
+                partition.setdefault(key[0], {})[key[1:]] = value
+        return partition
+
     def _collect_user_configuration(self):
         config = self.get_user_configuration()
         for name, value in self.named_modules():
@@ -480,11 +499,13 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
         return arguments
 
     def _assert_valid_configurable(self, *args):
-        if args[0] not in self.configurables:
-            raise ValueError(
-                f"Unknown configurable {args[0]} for {self.__class__.__name__}. "
-                f"Available configurables are {self.configurables}."
-            )
+        configurables = self.configurables
+        for name in args:
+            if name not in configurables:
+                raise ValueError(
+                    f"Unknown configurable {name} for {self.__class__.__name__}. "
+                    f"Available configurables are {configurables}."
+                )
 
     def _run_hooks(self, hook_name, instance=None):
         if instance is None:
@@ -495,20 +516,24 @@ class DeeplayModule(nn.Module, metaclass=ExtendedConstructorMeta):
     def __construct__(self):
         with not_top_level(ExtendedConstructorMeta):
             self._modules.clear()
+            # Partition the configuration once instead of scanning all of it
+            # for every child that is assigned during __init__.
+            self._user_config_by_head = self._partition_user_configuration()
             self._is_constructing = True
             self.__init__(*self._args, **self.kwargs)
             self._is_constructing = False
+            self._user_config_by_head = None
             self.__post_init__()
 
     @classmethod
     def get_argspec(cls):
-        spec = inspect.getfullargspec(cls.__init__)
+        spec = utils.getfullargspec(cls.__init__)
         spec.args.remove("self")
         return spec
 
     @classmethod
     def get_signature(cls):
-        sig = inspect.signature(cls.__init__)
+        sig = utils.signature(cls.__init__)
         # remove the first parameter
         sig = sig.replace(parameters=list(sig.parameters.values())[1:])
         return sig
@@ -72,6 +72,20 @@ class TestDecorators(unittest.TestCase):
         for mock in after_build_mocks:
             mock.assert_called_with(new_module)
 
+    def test_hooks_new_does_not_share(self):
+        module = DecoratedModule()
+        module.run_function_before_build(Mock())
+
+        new_module = module.new()
+        new_mock = Mock()
+        new_module.run_function_before_build(new_mock)
+
+        module.build()
+        new_mock.assert_not_called()
+
+        new_module.build()
+        new_mock.assert_called_once_with(new_module)
+
     def test_hooks_module(self):
         module = DecoratedModule()
 
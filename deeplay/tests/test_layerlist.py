@@ -79,6 +79,35 @@ class TestLayerList(unittest.TestCase):
             self.assertEqual(module.layers[1].in_features, 2, Wrapper)
             self.assertEqual(module.layers[2].in_features, 2, Wrapper)
 
+    def test_configure_list_create(self):
+        for Wrapper in [Wrapper1, Wrapper2, Wrapper3]:
+            module = Wrapper(5)
+            module.layers[3].configure(out_features=7)
+            created = module.create()
+            self.assertEqual(len(created.layers), 5, Wrapper)
+            self.assertEqual(created.layers[3].out_features, 7, Wrapper)
+            self.assertEqual(created.layers[2].out_features, 4, Wrapper)
+
+    def test_append_to_unconstructed_list(self):
+        class Wrapper(DeeplayModule):
+            def __init__(self):
+                super().__init__()
+                layers = LayerList(Layer(nn.Linear, 1, 2))
+                layers.append(Layer(nn.Linear, 2, 3))
+                self.layers = layers
+
+        module = Wrapper()
+        module.build()
+        self.assertEqual(len(module.layers), 2)
+        self.assertEqual(module.layers[0].in_features, 1)
+        self.assertEqual(module.layers[1].in_features, 2)
+
+    def test_getattr_missing(self):
+        layers = LayerList(Layer(nn.Linear, 1, 1), Layer(nn.Linear, 1, 1))
+        for name in ["2", "", "missing"]:
+            with self.assertRaises(AttributeError):
+                getattr(layers, name)
+
     def test_nested_lists(self):
         class Wrapper(DeeplayModule):
             def __init__(self, depth=3, width=3):
@@ -85,6 +85,14 @@ class TestDeeplayModule(unittest.TestCase):
         with self.assertRaises(ValueError):
             module.configure("invalid_param", 100)
 
+    def test_invalid_configure_kwargs(self):
+        # Nothing should be configured if any of the names is invalid
+        module = TestModule()
+        with self.assertRaises(ValueError):
+            module.configure(param1=10, invalid_param=100)
+        self.assertEqual(module.get_user_configuration(), {})
+        self.assertIsNone(module.param1)
+
     def test_configure_1(self):
         module = Module()
         module.configure(a=1)
@@ -0,0 +1,24 @@
+import unittest
+
+from deeplay import utils
+
+
+class DummyClass:
+    def __init__(self, a, b=1, *, c=2):
+        ...
+
+
+class TestUtils(unittest.TestCase):
+    def test_getfullargspec_returns_copy(self):
+        spec = utils.getfullargspec(DummyClass.__init__)
+        spec.args.remove("self")
+        spec.kwonlyargs.remove("c")
+
+        spec = utils.getfullargspec(DummyClass.__init__)
+        self.assertEqual(spec.args, ["self", "a", "b"])
+        self.assertEqual(spec.kwonlyargs, ["c"])
+
+    def test_signature_is_cached(self):
+        sig = utils.signature(DummyClass)
+        self.assertIs(sig, utils.signature(DummyClass))
+        self.assertEqual(list(sig.parameters), ["a", "b", "c"])
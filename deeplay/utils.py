@@ -0,0 +1,41 @@
+import inspect
+from functools import lru_cache
+from typing import Callable
+
+
+def getfullargspec(func: Callable) -> inspect.FullArgSpec:
+    """Cached version of `inspect.getfullargspec`.
+
+    The argument lists of the returned argspec are copies, so the caller is
+    free to modify them.
+    """
+    if _is_hashable(func):
+        spec = _cached_getfullargspec(func)
+    else:
+        spec = inspect.getfullargspec(func)
+    return spec._replace(args=list(spec.args), kwonlyargs=list(spec.kwonlyargs))
+
+
+def signature(func: Callable) -> inspect.Signature:
+    """Cached version of `inspect.signature`."""
+    if _is_hashable(func):
+        return _cached_signature(func)
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=1024)
+def _cached_getfullargspec(func: Callable) -> inspect.FullArgSpec:
+    return inspect.getfullargspec(func)
+
+
+@lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _is_hashable(obj) -> bool:
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True